@@ -32,11 +32,100 @@ class CartNode:
         self.subtotal = product.price * quantity
         self.next = None
 
+class CacheNode:
+    """Node for query cache doubly linked list"""
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+        self.prev = None
+        self.next = None
+
+class QueryCache:
+    """Bounded LRU cache using a dictionary and a doubly linked list"""
+    def __init__(self, capacity=64):
+        if capacity < 1:
+            raise ValueError("Cache capacity must be at least 1")
+        self.capacity = capacity
+        self.nodes = {}
+        self.head = None  # most recently used
+        self.tail = None  # least recently used
+        self.hits = 0
+        self.misses = 0
+    
+    def unlink(self, node):
+        """Remove a node from the doubly linked list"""
+        if node.prev:
+            node.prev.next = node.next
+        else:
+            self.head = node.next
+        if node.next:
+            node.next.prev = node.prev
+        else:
+            self.tail = node.prev
+        node.prev = None
+        node.next = None
+    
+    def push_front(self, node):
+        """Insert a node at the front of the doubly linked list"""
+        node.next = self.head
+        if self.head:
+            self.head.prev = node
+        self.head = node
+        if not self.tail:
+            self.tail = node
+    
+    def get(self, key):
+        """Return (found, value) and mark the entry as recently used"""
+        node = self.nodes.get(key)
+        if node is None:
+            self.misses += 1
+            return False, None
+        self.hits += 1
+        if node is not self.head:
+            self.unlink(node)
+            self.push_front(node)
+        return True, node.value
+    
+    def put(self, key, value):
+        """Store a value, evicting the least recently used entry if full"""
+        node = self.nodes.get(key)
+        if node:
+            node.value = value
+            self.unlink(node)
+            self.push_front(node)
+            return
+        if len(self.nodes) >= self.capacity:
+            oldest = self.tail
+            self.unlink(oldest)
+            del self.nodes[oldest.key]
+        node = CacheNode(key, value)
+        self.nodes[key] = node
+        self.push_front(node)
+    
+    def clear(self):
+        """Remove all entries but keep the hit/miss statistics"""
+        self.nodes = {}
+        self.head = None
+        self.tail = None
+    
+    def get_stats(self):
+        """Get hit/miss statistics of the cache"""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'size': len(self.nodes),
+            'capacity': self.capacity
+        }
+
 class CashierSystem:
     def __init__(self):
         self.products_head = None
         self.sales_head = None
         self.cart_head = None
+        self.catalog_version = 0
+        self.query_cache = QueryCache()
         self.current_user = "123"
         self.initialize_sample_data()
     
@@ -66,6 +155,25 @@ class CashierSystem:
             while current.next:
                 current = current.next
             current.next = new_node
+        self.bump_catalog_version()
+    
+    def bump_catalog_version(self):
+        """Mark the catalog as changed so cached reads are not reused"""
+        self.catalog_version += 1
+        self.query_cache.clear()
+    
+    def cached_query(self, key, compute):
+        """Return a cached read result for the current catalog version"""
+        cache_key = (self.catalog_version,) + key
+        found, results = self.query_cache.get(cache_key)
+        if not found:
+            results = compute()
+            self.query_cache.put(cache_key, results)
+        return list(results)
+    
+    def get_cache_stats(self):
+        """Get hit/miss statistics of the catalog query cache"""
+        return self.query_cache.get_stats()
     
     def find_product(self, product_name):
         """Find a product by name using linked list traversal"""
@@ -78,22 +186,30 @@ class CashierSystem:
     
     def find_product_by_name(self, search_term):
         """Find products by name (partial match) using linked list"""
-        results = []
-        current = self.products_head
-        while current:
-            if search_term.lower() in current.product.name.lower():
-                results.append(current.product)
-            current = current.next
-        return results
+        search_term = search_term.lower()
+        
+        def compute():
+            results = []
+            current = self.products_head
+            while current:
+                if search_term in current.product.name.lower():
+                    results.append(current.product)
+                current = current.next
+            return results
+        
+        return self.cached_query(('find_product_by_name', search_term), compute)
     
     def get_all_products(self):
         """Get all products from linked list"""
-        products = []
-        current = self.products_head
-        while current:
-            products.append(current.product)
-            current = current.next
-        return products
+        def compute():
+            products = []
+            current = self.products_head
+            while current:
+                products.append(current.product)
+                current = current.next
+            return products
+        
+        return self.cached_query(('get_all_products',), compute)
     
     def add_to_cart(self, product_name, quantity):
         """Add product to current transaction using linked list"""
@@ -176,6 +292,7 @@ class CashierSystem:
             current.product.quantity -= current.quantity
             items_list.append(f"{current.quantity}x {current.product.name}")
             current = current.next
+        self.bump_catalog_version()
         
         items_str = ", ".join(items_list)
         sale_record = f"{datetime.now().strftime('%Y-%m-%d %H:%M:%S')} - {items_str} - Total: ₱{total:.2f}"
@@ -187,13 +304,16 @@ class CashierSystem:
     
     def get_low_stock_items(self, threshold=10):
         """Get products with low stock using linked list traversal"""
-        low_stock = []
-        current = self.products_head
-        while current:
-            if current.product.quantity <= threshold:
-                low_stock.append(current.product)
-            current = current.next
-        return low_stock
+        def compute():
+            low_stock = []
+            current = self.products_head
+            while current:
+                if current.product.quantity <= threshold:
+                    low_stock.append(current.product)
+                current = current.next
+            return low_stock
+        
+        return self.cached_query(('get_low_stock_items', threshold), compute)
     
     def add_product(self, name, price, quantity):
         """Add new product to inventory linked list"""
@@ -210,6 +330,7 @@ class CashierSystem:
         if product:
             old_price = product.price
             product.price = new_price
+            self.bump_catalog_version()
             return True, f"Changed {product.name} price from ₱{old_price:.2f} to ₱{new_price:.2f}"
         return False, "Product not found"
     
@@ -218,6 +339,7 @@ class CashierSystem:
         product = self.find_product(product_name)
         if product:
             product.quantity += quantity
+            self.bump_catalog_version()
             return True, f"Restocked {product.name}. New quantity: {product.quantity}"
         return False, "Product not found"
 